@@ -41,6 +41,8 @@
 
 _logger = logging.getLogger(__name__)
 
+_NUMBER_TYPES = (float, int, np.float64, np.float32, np.int64)
+
 
 class NoneFloat(t.CFloat):   # Lazy solution, but usable
     default_value = None
@@ -117,11 +119,19 @@ class Parameter(t.HasTraits):
 
     """
     __number_of_elements = 1
+    _is_scalar = True
     __value = 0
     __free = True
-    _bounds = (None, None)
+    __bounds = (None, None)
+    _bmin_cached = None
+    _bmax_cached = None
+    _bmin_arr = None
+    _bmax_arr = None
     __twin = None
     _axes_manager = None
+    # Floating point type of the values and std fields of ``map``. Set it to
+    # np.float32 to halve the size of large maps, at the cost of precision.
+    _map_dtype = np.float64
     __ext_bounded = False
     __ext_force_positive = False
 
@@ -294,68 +304,107 @@ def twin_inverse_function(self, value):
         self._twin_inverse_function = value
 
     def _get_value(self):
-        if self.twin is None:
+        # Read the private attribute rather than the twin property, as this
+        # is called every time the value is read
+        twin = self.__twin
+        if twin is None:
             return self.__value
+        elif self.twin_function:
+            return self.twin_function(twin.value)
         else:
-            if self.twin_function:
-                return self.twin_function(self.twin.value)
-            else:
-                return self.twin.value
+            return twin.value
 
     def _set_value(self, value):
+        # Dispatch to the setter specialised for the number of elements.
+        # Branch on the plain attribute instead of caching a bound method in
+        # the instance, which would be shared with (deep) copies.
+        if self._is_scalar:
+            self._set_value_scalar(value)
+        else:
+            self._set_value_array(value)
+
+    def _set_value_scalar(self, value):
+        # Numbers, by far the most common values, have no length. Skip the
+        # check for them, as raising the TypeError is comparatively slow.
+        if type(value) not in _NUMBER_TYPES:
+            try:
+                # Use try/except instead of hasattr("__len__") because a
+                # numpy memmap has a __len__ wrapper even for numbers that
+                # raises a TypeError when calling. See issue #349.
+                if len(value) != 1:
+                    raise ValueError(
+                        "The length of the parameter must be ", 1)
+                elif not isinstance(value, tuple):
+                    value = tuple(value)
+            except TypeError:
+                pass
+        if self.__twin is not None:
+            self._set_twin_value(value)
+            return
+
+        old_value = self.__value
+        if self.__ext_bounded is False:
+            self.__value = value
+        else:
+            # Python built-ins are much faster than numpy ufuncs on numbers,
+            # but abs does not accept the 1-tuples set from sequences
+            if self.__ext_force_positive is True:
+                if type(value) in _NUMBER_TYPES:
+                    value = abs(value)
+                else:
+                    value = np.abs(value)
+            bmin = self._bmin_cached
+            bmax = self._bmax_cached
+            if bmin is not None and value <= bmin:
+                value = bmin
+            elif bmax is not None and value >= bmax:
+                value = bmax
+            self.__value = value
+        self._notify_value(old_value)
+
+    def _set_value_array(self, value):
         try:
-            # Use try/except instead of hasattr("__len__") because a numpy
-            # memmap has a __len__ wrapper even for numbers that raises a
-            # TypeError when calling. See issue #349.
+            # See _set_value_scalar
             if len(value) != self._number_of_elements:
                 raise ValueError(
                     "The length of the parameter must be ",
                     self._number_of_elements)
-            else:
-                if not isinstance(value, tuple):
-                    value = tuple(value)
+            elif not isinstance(value, tuple):
+                value = tuple(value)
         except TypeError:
-            if self._number_of_elements != 1:
-                raise ValueError(
-                    "The length of the parameter must be ",
-                    self._number_of_elements)
-        old_value = self.__value
-
-        if self.twin is not None:
-            if self.twin_function is not None:
-                if self.twin_inverse_function is not None:
-                    self.twin.value = self.twin_inverse_function(value)
-                    return
-                else:
-                    raise AttributeError(
-                        "This parameter has a ``twin_function`` but"
-                        "its ``twin_inverse_function`` is not defined.")
-            else:
-                self.twin.value = value
-                return
+            raise ValueError(
+                "The length of the parameter must be ",
+                self._number_of_elements)
+        if self.__twin is not None:
+            self._set_twin_value(value)
+            return
 
-        if self.ext_bounded is False:
+        old_value = self.__value
+        if self.__ext_bounded is False:
             self.__value = value
         else:
-            if self.ext_force_positive is True:
-                value = np.abs(value)
-            if self._number_of_elements == 1:
-                if self.bmin is not None and value <= self.bmin:
-                    self.__value = self.bmin
-                elif self.bmax is not None and value >= self.bmax:
-                    self.__value = self.bmax
-                else:
-                    self.__value = value
+            # Clip in place in a single work array to avoid creating further
+            # temporary arrays, the value itself is stored as a tuple. The
+            # array is not kept in the instance so copies never share it.
+            buf = np.array(value, dtype=float)
+            if self.__ext_force_positive is True:
+                np.abs(buf, out=buf)
+            np.clip(buf, self._bmin_arr, self._bmax_arr, out=buf)
+            self.__value = tuple(buf)
+        self._notify_value(old_value)
+
+    def _set_twin_value(self, value):
+        if self.twin_function is not None:
+            if self.twin_inverse_function is not None:
+                self.twin.value = self.twin_inverse_function(value)
             else:
-                bmin = (self.bmin if self.bmin is not None
-                        else -np.inf)
-                bmax = (self.bmax if self.bmin is not None
-                        else np.inf)
-                self.__value = np.clip(value, bmin, bmax)
-
-        if (self._number_of_elements != 1 and
-                not isinstance(self.__value, tuple)):
-            self.__value = tuple(self.__value)
+                raise AttributeError(
+                    "This parameter has a ``twin_function`` but"
+                    "its ``twin_inverse_function`` is not defined.")
+        else:
+            self.twin.value = value
+
+    def _notify_value(self, old_value):
         if old_value != self.__value:
             self.events.value_changed.trigger(value=self.__value,
                                               obj=self)
@@ -412,15 +461,35 @@ def _get_twin(self):
         return self.__twin
     twin = property(_get_twin, _set_twin)
 
-    def _get_bmin(self):
-        if self._number_of_elements == 1:
-            return self._bounds[0]
+    @property
+    def _bounds(self):
+        return self.__bounds
+
+    @_bounds.setter
+    def _bounds(self, arg):
+        self.__bounds = arg
+        # Cache bmin and bmax, which are read every time the value is set
+        if self._is_scalar:
+            self._bmin_cached = arg[0]
+            self._bmax_cached = arg[1]
         else:
-            return self._bounds[0][0]
+            self._bmin_cached = arg[0][0]
+            self._bmax_cached = arg[0][1]
+            # Bounds of each element used to clip the value, with infinite
+            # bounds where they are not defined
+            self._bmin_arr = np.array(
+                [-np.inf if bmin is None else bmin for bmin, _ in arg],
+                dtype=float)
+            self._bmax_arr = np.array(
+                [np.inf if bmax is None else bmax for _, bmax in arg],
+                dtype=float)
+
+    def _get_bmin(self):
+        return self._bmin_cached
 
     def _set_bmin(self, arg):
         old_value = self.bmin
-        if self._number_of_elements == 1:
+        if self._is_scalar:
             self._bounds = (arg, self.bmax)
         else:
             self._bounds = ((arg, self.bmax),) * self._number_of_elements
@@ -429,14 +498,11 @@ def _set_bmin(self, arg):
         self.trait_property_changed('bmin', old_value, arg)
 
     def _get_bmax(self):
-        if self._number_of_elements == 1:
-            return self._bounds[1]
-        else:
-            return self._bounds[0][1]
+        return self._bmax_cached
 
     def _set_bmax(self, arg):
         old_value = self.bmax
-        if self._number_of_elements == 1:
+        if self._is_scalar:
             self._bounds = (self.bmin, arg)
         else:
             self._bounds = ((self.bmin, arg),) * self._number_of_elements
@@ -456,10 +522,13 @@ def _number_of_elements(self, arg):
         if arg <= 1:
             raise ValueError("Please provide an integer number equal "
                              "or greater to 1")
-        self._bounds = ((self.bmin, self.bmax),) * arg
+        bounds = ((self.bmin, self.bmax),) * arg
         self.__number_of_elements = arg
+        # Cached as an attribute because it is checked in the hot paths
+        self._is_scalar = arg == 1
+        self._bounds = bounds
 
-        if arg == 1:
+        if self._is_scalar:
             self._Parameter__value = 0
         else:
             self._Parameter__value = (0,) * arg
@@ -488,22 +557,31 @@ def ext_force_positive(self, arg):
             # Update the value to take into account the new bounds
             self.value = self.value
 
-    def store_current_value_in_array(self):
+    def store_current_value_in_array(self, indices=None):
         """Store the value and std attributes.
 
+        Parameters
+        ----------
+        indices : {None, tuple}
+            Indices of the map where to store the values. If None, the
+            current indices of the axes manager, in array order.
+
         See also
         --------
         fetch, assign_current_value_to_all
 
         """
-        indices = self._axes_manager.indices[::-1]
-        # If it is a single spectrum indices is ()
-        if not indices:
-            indices = (0,)
-        self.map['values'][indices] = self.value
-        self.map['is_set'][indices] = True
+        if indices is None:
+            indices = self._axes_manager.indices[::-1]
+            # If it is a single spectrum indices is ()
+            if not indices:
+                indices = (0,)
         if self.std is not None:
-            self.map['std'][indices] = self.std
+            # Write the whole record at once rather than field by field
+            self.map[indices] = (self.value, self.std, True)
+        else:
+            self.map['values'][indices] = self.value
+            self.map['is_set'][indices] = True
 
     def fetch(self):
         """Fetch the stored value and std attributes.
@@ -543,9 +621,14 @@ def assign_current_value_to_all(self, mask=None):
 
         """
         if mask is None:
-            mask = np.zeros(self.map.shape, dtype='bool')
-        self.map['values'][mask == False] = self.value
-        self.map['is_set'][mask == False] = True
+            # ndarray.fill does not broadcast sequences such as the 1-tuples
+            # set from length-1 sequences, so assign the values instead
+            self.map['values'][...] = self.value
+            self.map['is_set'].fill(True)
+        else:
+            unmasked = np.logical_not(mask)
+            self.map['values'][unmasked] = self.value
+            self.map['is_set'][unmasked] = True
 
     def _create_array(self):
         """Create the map array to store the information in
@@ -557,15 +640,15 @@ def _create_array(self):
             shape = [1, ]
         # Shape-1 fields in dtypes won’t be collapsed to scalars in a future
         # numpy version (see release notes numpy 1.17.0)
-        if self._number_of_elements > 1:
+        if not self._is_scalar:
             dtype_ = np.dtype([
-                ('values', 'float', self._number_of_elements),
-                ('std', 'float', self._number_of_elements),
+                ('values', self._map_dtype, self._number_of_elements),
+                ('std', self._map_dtype, self._number_of_elements),
                 ('is_set', 'bool')])
         else:
             dtype_ = np.dtype([
-                ('values', 'float'),
-                ('std', 'float'),
+                ('values', self._map_dtype),
+                ('std', self._map_dtype),
                 ('is_set', 'bool')])
         if (self.map is None or self.map.shape != shape or
                 self.map.dtype != dtype_):
@@ -609,7 +692,7 @@ def as_signal(self, field='values'):
                                     (self.name, self.component.name))
         for axis in s.axes_manager._axes:
             axis.navigate = False
-        if self._number_of_elements > 1:
+        if not self._is_scalar:
             s.axes_manager._append_axis(
                 size=self._number_of_elements,
                 name=self.name,
@@ -892,8 +975,29 @@ def __repr__(self):
     def _update_free_parameters(self):
         self.free_parameters = sorted([par for par in self.parameters if
                                        par.free], key=lambda x: x.name)
+        self._fixed_parameters = [par for par in self.parameters if
+                                  not par.free]
         self._nfree_param = sum([par._number_of_elements for par in
                                  self.free_parameters])
+        # The position of the parameters in the arrays passed to
+        # fetch_values_from_array is computed here instead of at every call
+        self._free_parameters_layout = self._get_parameters_layout(
+            self.free_parameters)
+        self._parameters_layout = self._get_parameters_layout(
+            sorted(self.parameters, key=lambda x: x.name))
+
+    @staticmethod
+    def _get_parameters_layout(parameters):
+        """Return a list of (parameter, index, length) tuples giving the
+        position of the parameters in a flat array of parameter values.
+        """
+        layout = []
+        i = 0
+        for parameter in parameters:
+            length = parameter._number_of_elements
+            layout.append((parameter, i, length))
+            i += length
+        return layout
 
     def update_number_parameters(self):
         i = 0
@@ -904,18 +1008,18 @@ def update_number_parameters(self):
 
     def fetch_values_from_array(self, p, p_std=None, onlyfree=False):
         if onlyfree is True:
-            parameters = self.free_parameters
+            layout = self._free_parameters_layout
         else:
-            parameters = self.parameters
-        i = 0
-        for parameter in sorted(parameters, key=lambda x: x.name):
-            length = parameter._number_of_elements
-            parameter.value = (p[i] if length == 1 else p[i:i + length])
-            if p_std is not None:
-                parameter.std = (p_std[i] if length == 1 else
-                                 tuple(p_std[i:i + length]))
-
-            i += length
+            layout = self._parameters_layout
+        for parameter, i, length in layout:
+            if length == 1:
+                parameter.value = p[i]
+                if p_std is not None:
+                    parameter.std = p_std[i]
+            else:
+                parameter.value = p[i:i + length]
+                if p_std is not None:
+                    parameter.std = tuple(p_std[i:i + length])
 
     def _create_active_array(self):
         shape = self._axes_manager._navigation_shape_in_array
@@ -934,8 +1038,14 @@ def _create_arrays(self):
             parameter._create_array()
 
     def store_current_parameters_in_map(self):
+        # Get the indices once for all the parameters, as building them
+        # from the axes manager is slower than storing a value
+        indices = self._axes_manager.indices[::-1]
+        # If it is a single spectrum indices is ()
+        if not indices:
+            indices = (0,)
         for parameter in self.parameters:
-            parameter.store_current_value_in_array()
+            parameter.store_current_value_in_array(indices)
 
     def fetch_stored_values(self, only_fixed=False):
         if self.active_is_multidimensional:
@@ -943,8 +1053,7 @@ def fetch_stored_values(self, only_fixed=False):
             # functions.
             self.active = self.active
         if only_fixed is True:
-            parameters = (set(self.parameters) -
-                          set(self.free_parameters))
+            parameters = self._fixed_parameters
         else:
             parameters = self.parameters
         parameters = [parameter for parameter in parameters
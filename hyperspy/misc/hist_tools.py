@@ -30,6 +30,35 @@
 _logger = logging.getLogger(__name__)
 
 
+def _check_deprecated_bins(bins):
+    """Return the name of the bin estimator `bins`, warning if it is one of
+    the deprecated aliases.
+    """
+    if isinstance(bins, str):
+        _deprecated_bins = {"scotts": "scott", "freedman": "fd"}
+        new_bins = _deprecated_bins.get(bins, None)
+        if new_bins:
+            warnings.warn(
+                f"`bins='{bins}'` has been deprecated and will be removed "
+                f"in HyperSpy 2.0. Please use `bins='{new_bins}'` instead.",
+                VisibleDeprecationWarning,
+                )
+            bins = new_bins
+    return bins
+
+
+def _warn_max_num_bins(bins, bins_len, max_num_bins):
+    """Log that the number of bins estimated with `bins` is capped."""
+    _logger.warning(
+        f"Estimated number of bins using `bins='{bins}'` "
+        f"is too large ({bins_len}). Capping the number of bins "
+        f"at `max_num_bins={max_num_bins}`. Consider using an "
+        "alternative method for calculating the bins such as "
+        "`bins='scott'`, or increasing the value of the "
+        "`max_num_bins` keyword argument."
+    )
+
+
 def histogram(a, bins="fd", range=None, max_num_bins=250, weights=None, **kwargs):
     """Enhanced histogram.
 
@@ -74,16 +103,7 @@ def histogram(a, bins="fd", range=None, max_num_bins=250, weights=None, **kwargs
     if isinstance(a, da.Array):
         return histogram_dask(a, bins=bins, max_num_bins=max_num_bins, **kwargs)
 
-    if isinstance(bins, str):
-        _deprecated_bins = {"scotts": "scott", "freedman": "fd"}
-        new_bins = _deprecated_bins.get(bins, None)
-        if new_bins:
-            warnings.warn(
-                f"`bins='{bins}'` has been deprecated and will be removed "
-                f"in HyperSpy 2.0. Please use `bins='{new_bins}'` instead.",
-                VisibleDeprecationWarning,
-                )
-            bins = new_bins
+    bins = _check_deprecated_bins(bins)
 
     _old_bins = bins
 
@@ -107,14 +127,7 @@ def histogram(a, bins="fd", range=None, max_num_bins=250, weights=None, **kwargs
         # https://github.com/hyperspy/hyperspy/issues/784,
         # we log a warning and cap the number of bins at
         # a sensible value.
-        _logger.warning(
-            f"Estimated number of bins using `bins='{_old_bins}'` "
-            f"is too large ({_bins_len}). Capping the number of bins "
-            f"at `max_num_bins={max_num_bins}`. Consider using an "
-            "alternative method for calculating the bins such as "
-            "`bins='scott'`, or increasing the value of the "
-            "`max_num_bins` keyword argument."
-        )
+        _warn_max_num_bins(_old_bins, _bins_len, max_num_bins)
         bins = max_num_bins
 
     return np.histogram(a, bins=bins, **kwargs)
@@ -169,16 +182,7 @@ def histogram_dask(a, bins="fd", max_num_bins=250, **kwargs):
     if a.ndim != 1:
         a = a.flatten()
 
-    if isinstance(bins, str):
-        _deprecated_bins = {"scotts": "scott", "freedman": "fd"}
-        new_bins = _deprecated_bins.get(bins, None)
-        if new_bins:
-            warnings.warn(
-                f"`bins='{bins}'` has been deprecated and will be removed "
-                f"in HyperSpy 2.0. Please use `bins='{new_bins}'` instead.",
-                VisibleDeprecationWarning,
-                )
-            bins = new_bins
+    bins = _check_deprecated_bins(bins)
 
     _old_bins = bins
 
@@ -199,14 +203,7 @@ def histogram_dask(a, bins="fd", max_num_bins=250, **kwargs):
         # https://github.com/hyperspy/hyperspy/issues/784,
         # we log a warning and cap the number of bins at
         # a sensible value.
-        _logger.warning(
-            f"Estimated number of bins using `bins='{_old_bins}'` "
-            f"is too large ({_bins_len}). Capping the number of bins "
-            f"at `max_num_bins={max_num_bins}`. Consider using an "
-            "alternative method for calculating the bins such as "
-            "`bins='scott'`, or increasing the value of the "
-            "`max_num_bins` keyword argument."
-        )
+        _warn_max_num_bins(_old_bins, _bins_len, max_num_bins)
         bins = max_num_bins
         kwargs["range"] = da.compute(a.min(), a.max())
 
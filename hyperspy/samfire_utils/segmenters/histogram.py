@@ -17,9 +17,147 @@
 # along with  HyperSpy.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
-from scipy.signal import argrelextrema
+from numba import njit, prange
 
-from hyperspy.misc.hist_tools import histogram
+from hyperspy.misc.hist_tools import (
+    _check_deprecated_bins, _warn_max_num_bins, histogram)
+
+# Maximum number of values used to estimate the interquartile range of the
+# Freedman-Diaconis bin width, larger arrays are subsampled
+_FD_SAMPLE_SIZE = 4096
+
+
+def _fd_bin_width(par):
+    """Freedman-Diaconis bin width of `par`.
+
+    The quartiles are found with ``np.partition`` and interpolated linearly
+    as in ``np.percentile``, which gives the same width as NumPy with less
+    overhead. For arrays of at least ``2 * _FD_SAMPLE_SIZE`` values, they are
+    estimated from a regular subsample of the values.
+    """
+    n = par.size
+    step = n // _FD_SAMPLE_SIZE
+    sample = par.ravel()[::step] if step > 1 else par
+    m = sample.size
+    position = np.array([0.25, 0.75]) * (m - 1)
+    below = np.floor(position).astype(np.intp)
+    above = np.minimum(below + 1, m - 1)
+    sample = np.partition(sample, np.concatenate((below, above)), axis=None)
+    t = position - below
+    diff = sample[above] - sample[below]
+    q25, q75 = np.where(t >= 0.5, sample[above] - diff * (1 - t),
+                        sample[below] + diff * t)
+    return 2.0 * (q75 - q25) * n ** (-1.0 / 3.0)
+
+
+def _uniform_bin_estimator(bins):
+    """Return `bins` if it gives bins of equal width, i.e. if it is an
+    integer, 'fd' or 'scott' (or their deprecated aliases), otherwise None.
+    Warns for the deprecated aliases, as ``hist_tools.histogram`` does.
+    """
+    bins = _check_deprecated_bins(bins)
+    if isinstance(bins, str):
+        if bins in ('fd', 'scott'):
+            return bins
+    elif isinstance(bins, (int, np.integer)):
+        return bins
+    return None
+
+
+def _uniform_bins(par, bins, lo, hi, max_num_bins=250):
+    """Number of bins and range of the histogram of `par` for the bin
+    estimators that give bins of equal width.
+
+    Gives the same bins as ``np.histogram_bin_edges(par, bins)``, but
+    returned as a number of bins and a range, so that the histogram can be
+    computed without searching the bin edges.
+
+    Parameters
+    ----------
+    par : numpy array
+    bins : int or str
+        As returned by ``_uniform_bin_estimator``.
+    lo, hi : float
+        Minimum and maximum of `par`.
+
+    Returns
+    -------
+    nbins, range : int, (float, float)
+    """
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    if isinstance(bins, str):
+        if bins == 'fd':
+            width = _fd_bin_width(par)
+        else:
+            width = (24.0 * np.pi**0.5 / par.size)**(1.0 / 3.0) * np.std(par)
+        nbins = int(np.ceil((hi - lo) / width)) if width else 1
+    else:
+        nbins = bins
+    # Capped as in hist_tools.histogram, see issue #784, which compares and
+    # reports the number of bin edges
+    if nbins + 1 > max_num_bins:
+        _warn_max_num_bins(bins, nbins + 1, max_num_bins)
+        nbins = max_num_bins
+    return nbins, (lo, hi)
+
+
+@njit(parallel=True, cache=True)
+def _batch_min_max(pars):  # pragma: no cover
+    """Minimum and maximum of each row of `pars`, in a single pass. Both are
+    NaN for the rows with NaN values, as with ``np.min`` and ``np.max``.
+    """
+    los = np.empty(pars.shape[0])
+    his = np.empty(pars.shape[0])
+    for p in prange(pars.shape[0]):
+        lo = np.inf
+        hi = -np.inf
+        for x in pars[p]:
+            if np.isnan(x):
+                lo = hi = x
+                break
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+        los[p] = lo
+        his[p] = hi
+    return los, his
+
+
+@njit(parallel=True, cache=True)
+def _batch_histogram(pars, edges, nbins, out):  # pragma: no cover
+    """Histograms of the rows of `pars` with bins of equal width.
+
+    Parameters
+    ----------
+    pars : numpy array
+        2D array, one histogram is computed for each row.
+    edges : numpy array
+        2D array with the bin edges of each row in its first ``nbins + 1``
+        columns.
+    nbins : numpy array
+        Number of bins of each row.
+    out : numpy array
+        2D array where the counts are added, in the first `nbins` columns.
+    """
+    for p in prange(pars.shape[0]):
+        n = nbins[p]
+        lo = edges[p, 0]
+        hi = edges[p, n]
+        norm = n / (hi - lo)
+        for x in pars[p]:
+            if not lo <= x <= hi:
+                continue
+            k = int((x - lo) * norm)
+            if k == n:
+                k -= 1
+            # Same correction for the rounding errors as np.histogram
+            if x < edges[p, k]:
+                k -= 1
+            elif k != n - 1 and x >= edges[p, k + 1]:
+                k += 1
+            out[p, k] += 1
 
 
 class HistogramSegmenter(object):
@@ -42,16 +180,16 @@ def most_frequent(self):
         for c_n, comp in self.database.items():
             comp_dict = {}
             for p_n, (hist, bin_edges) in comp.items():
-                # calculate frequent values
-                maxima_hist_ind = argrelextrema(
-                    np.append(
-                        0,
-                        hist),
-                    np.greater,
-                    mode='wrap')
+                # calculate frequent values. A bin is a local maximum if it
+                # is strictly greater than both neighbours, the histogram
+                # being padded with zeros at both ends.
+                left = np.concatenate(([0], hist[:-1]))
+                right = np.concatenate((hist[1:], [0]))
+                maxima_hist_ind = np.flatnonzero((hist > left) &
+                                                 (hist > right))
                 middles_of_maxima = 0.5 * \
                     (bin_edges[maxima_hist_ind] +
-                     bin_edges[([i - 1 for i in maxima_hist_ind[0]],)])
+                     bin_edges[maxima_hist_ind + 1])
                 comp_dict[p_n] = middles_of_maxima.tolist()
             freq[c_n] = comp_dict
         return freq
@@ -70,6 +208,10 @@ def update(self, value_dict):
         """
         # recalculate with values. All values are passed, not just new
         self.database = {}
+        # Parameters histogrammed with bins of equal width, grouped by size
+        # to compute all the histograms of a group in a single call
+        uniform = {}
+        estimator = _uniform_bin_estimator(self.bins)
         for component_name, component in value_dict.items():
             comp_dict = {}
             for par_name, par in component.items():
@@ -77,6 +219,34 @@ def update(self, value_dict):
                     comp_dict[par_name] = np.histogram(par,
                                                        max(10,
                                                            self._min_points))
+                    continue
+                if estimator is not None:
+                    uniform.setdefault(par.size, []).append(
+                        (component_name, par_name, par))
                 else:
                     comp_dict[par_name] = histogram(par, bins=self.bins)
             self.database[component_name] = comp_dict
+
+        for group in uniform.values():
+            pars = np.stack([par.ravel() for _, _, par in group])
+            pars = pars.astype(float, copy=False)
+            los, his = _batch_min_max(pars)
+            # Same error as np.histogram for NaN and infinite values, for
+            # all bin estimators
+            for lo, hi in zip(los, his):
+                if not (np.isfinite(lo) and np.isfinite(hi)):
+                    raise ValueError(
+                        "autodetected range of [{}, {}] is not finite"
+                        .format(lo, hi))
+            bins = [_uniform_bins(row, estimator, lo, hi)
+                    for row, lo, hi in zip(pars, los, his)]
+            nbins = np.array([nb for nb, _ in bins], dtype=np.intp)
+            edges = np.zeros((len(group), nbins.max() + 1))
+            for row, (nb, range_) in zip(edges, bins):
+                row[:nb + 1] = np.linspace(*range_, nb + 1)
+            hist = np.zeros((len(group), nbins.max()), dtype=np.intp)
+            _batch_histogram(pars, edges, nbins, hist)
+            for i, (component_name, par_name, _) in enumerate(group):
+                nb = nbins[i]
+                self.database[component_name][par_name] = (
+                    hist[i, :nb], edges[i, :nb + 1])
@@ -17,6 +17,7 @@
 # along with  HyperSpy.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import copy
 from unittest import mock
 
 import numpy as np
@@ -82,6 +83,12 @@ def test_ext_force_positive(self):
         self.par.value = -3
         assert self.par.value == 2
 
+    def test_ext_force_positive_sequence(self):
+        self.par.ext_bounded = True
+        self.par.ext_force_positive = True
+        self.par.value = [-3.]
+        np.testing.assert_array_equal(self.par.value, [3.])
+
     def test_number_of_elements(self):
         assert len(self.par) == 1
 
@@ -136,6 +143,16 @@ def test_map_size2(self):
         assert self.par.map['is_set'][1]
         assert self.par.map['std'][1] == 0.1
 
+    def test_map_dtype(self):
+        self.par._axes_manager = DummyAxesManager()
+        self.par._axes_manager.navigation_shape = [2, ]
+        self.par._create_array()
+        assert self.par.map['values'].dtype == np.float64
+        self.par._map_dtype = np.float32
+        self.par._create_array()
+        assert self.par.map['values'].dtype == np.float32
+        assert self.par.map['std'].dtype == np.float32
+
 
 class TestParameterLen2:
 
@@ -166,6 +183,32 @@ def test_set_value_bounded(self):
         self.par.value = (4, 4)
         assert self.par.value == (3, 3)
 
+    def test_set_value_bounded_bmax_only(self):
+        self.par.bmax = 3
+        self.par.ext_bounded = True
+        self.par.value = (-1, 4)
+        assert self.par.value == (-1, 3)
+
+    def test_deepcopy(self):
+        self.par.value = (1, 1)
+        dpar = copy.deepcopy(self.par)
+        dpar.value = (2, 3)
+        assert dpar.value == (2, 3)
+        assert self.par.value == (1, 1)
+
+    def test_deepcopy_bounded(self):
+        self.par.bmin = 1
+        self.par.bmax = 3
+        self.par.ext_bounded = True
+        self.par.value = (2, 2)
+        dpar = copy.deepcopy(self.par)
+        dpar.value = (0.5, 4)
+        assert dpar.value == (1, 3)
+        assert self.par.value == (2, 2)
+        self.par.value = (2.5, 0)
+        assert self.par.value == (2.5, 1)
+        assert dpar.value == (1, 3)
+
     def test_ext_force_positive(self):
         self.par.ext_bounded = True
         self.par.ext_force_positive = True
@@ -244,6 +287,12 @@ def test_slave_fixed(self):
         self.p2.twin = self.p1
         assert not self.p2.free
 
+    def test_twins_not_shared(self):
+        self.p2.twin = self.p1
+        assert self.p1._twins == {self.p2}
+        assert not self.p2._twins
+        assert not Parameter()._twins
+
     def test_twin_value(self):
         self.p2.twin = self.p1
         self.p1.value = 3
@@ -337,3 +386,31 @@ def test_store_current_values_no_indices(self):
         assert par.map['is_set'][0]
         assert par.map['std'][0] == 4.5
         assert par.map['values'][0] == 3.5
+
+    def test_store_current_values_given_indices(self):
+        par = self.par
+        par._axes_manager.indices = (0,)
+        par.value = 3.5
+        par.std = 4.5
+        par.store_current_value_in_array((2,))
+        assert not par.map['is_set'][0]
+        assert par.map['is_set'][2]
+        assert par.map['std'][2] == 4.5
+        assert par.map['values'][2] == 3.5
+
+    def test_assign_current_value_to_all(self):
+        par = self.par
+        par.value = 7.
+        par.assign_current_value_to_all(mask=np.array([False, True, False]))
+        np.testing.assert_array_equal(par.map['values'], [7., 3., 7.])
+        np.testing.assert_array_equal(par.map['is_set'], [True, False, True])
+        par.assign_current_value_to_all()
+        np.testing.assert_array_equal(par.map['values'], [7., 7., 7.])
+        assert par.map['is_set'].all()
+
+    def test_assign_current_value_to_all_sequence(self):
+        par = self.par
+        par.value = [4.]
+        par.assign_current_value_to_all()
+        np.testing.assert_array_equal(par.map['values'], [4., 4., 4.])
+        assert par.map['is_set'].all()
@@ -15,8 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with HyperSpy. If not, see <http://www.gnu.org/licenses/>.
 
+import logging
+
 import numpy as np
+import pytest
 
+from hyperspy.exceptions import VisibleDeprecationWarning
 from hyperspy.misc.hist_tools import histogram
 from hyperspy.samfire_utils.segmenters.histogram import HistogramSegmenter
 
@@ -84,3 +88,63 @@ def test_update(self):
         print('--------------------------------------\n calculated:')
         print(s.database)
         assert compare_two_value_dicts(s.database, self.test_database)
+
+    def test_update_fd(self):
+        s = self.s
+        s.update(self.test_dict)
+        hist, bin_edges = histogram(self.test_dict['two']['sigma'], 'fd')
+        np.testing.assert_array_equal(s.database['two']['sigma'][0], hist)
+        np.testing.assert_allclose(s.database['two']['sigma'][1], bin_edges)
+
+    def test_update_uniform_bins_batched(self):
+        rng = np.random.RandomState(0)
+        value_dict = {'one': {'A': rng.normal(size=100),
+                              'B': rng.uniform(size=100)},
+                      'two': {'centre': rng.normal(size=200),
+                              'sigma': np.full(100, 3.)}}
+        s = self.s
+        for bins in ['fd', 'scott', 15]:
+            s.bins = bins
+            s.update(value_dict)
+            for c_n, comp in value_dict.items():
+                for p_n, par in comp.items():
+                    hist, bin_edges = np.histogram(par, bins)
+                    np.testing.assert_array_equal(s.database[c_n][p_n][0],
+                                                  hist)
+                    np.testing.assert_allclose(s.database[c_n][p_n][1],
+                                               bin_edges)
+
+    @pytest.mark.parametrize("bins", ['fd', 250, 251])
+    def test_update_max_num_bins_logger_warning(self, bins, caplog):
+        s = self.s
+        s.bins = bins
+        values = np.concatenate((np.linspace(0, 1, 100), [1e6]))
+        value_dict = {'one': {'A': values}}
+        with caplog.at_level(logging.WARNING):
+            s.update(value_dict)
+        assert s.database['one']['A'][0].shape == (250,)
+        assert "Capping the number of bins" in caplog.text
+        # Same warning as hist_tools.histogram
+        messages = caplog.messages
+        caplog.clear()
+        with caplog.at_level(logging.WARNING):
+            histogram(values, bins=bins)
+        assert caplog.messages == messages
+
+    @pytest.mark.parametrize("bins", ["scotts", "freedman"])
+    def test_update_deprecation_warnings(self, bins):
+        s = self.s
+        s.bins = bins
+        with pytest.warns(VisibleDeprecationWarning,
+                          match="has been deprecated and will be removed"):
+            s.update(self.test_dict)
+
+    @pytest.mark.parametrize("bins", ['fd', 'scott', 15])
+    @pytest.mark.parametrize("value", [np.nan, np.inf])
+    def test_update_not_finite(self, bins, value):
+        s = self.s
+        s.bins = bins
+        values = np.linspace(0, 1, 100)
+        values[50] = value
+        with pytest.raises(ValueError, match="is not finite"):
+            s.update({'one': {'A': values}})